@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import json
-from typing import AsyncContextManager, AsyncIterator
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, TypeVar
 
 from nats.aio.client import Client as NATS
 from nats.aio.msg import Msg
@@ -13,21 +13,75 @@ from nats_contrib.request_many import (
 
 from .. import internal
 from ..api import API_PREFIX
-from ..models import PingInfo, ServiceInfo, ServiceStats
+from ..models import Base, PingInfo, ServiceInfo, ServiceStats
 from .errors import ServiceError
 
+if TYPE_CHECKING:
+    from json import loads as json_loads
+else:
+    try:
+        from orjson import loads as json_loads
+    except ImportError:
+        from json import JSONDecoder, detect_encoding
+
+        _json_decode = JSONDecoder().decode
+
+        def json_loads(data: bytes | str) -> Any:
+            # Detect UTF-8/16/32 like json.loads does
+            if isinstance(data, str):
+                return _json_decode(data)
+            return _json_decode(data.decode(detect_encoding(data), "surrogatepass"))
+
+
+M = TypeVar("M", bound=Base)
+
+_PING = internal.ServiceVerb.PING
+_INFO = internal.ServiceVerb.INFO
+_STATS = internal.ServiceVerb.STATS
+
+
+@lru_cache(maxsize=1024)
+def _subject(
+    verb: internal.ServiceVerb,
+    service: str | None,
+    id: str | None,
+    api_prefix: str,
+) -> str:
+    """Get the internal subject for a verb, caching the result."""
+    return internal.get_internal_subject(verb, service, id, api_prefix)
+
 
 class Client:
+    __slots__ = ("nc", "api_prefix", "request_executor")
 
     def __init__(
         self,
         nc: NATS,
         default_max_wait: float = 0.5,
         api_prefix: str = API_PREFIX,
+        request_executor: RequestManyExecutor | None = None,
     ) -> None:
+        """Create a new micro client.
+
+        Args:
+            nc: The NATS client to use.
+            default_max_wait: The default maximum time to wait for responses
+                when requesting many services.
+            api_prefix: The prefix of the micro API subjects.
+            request_executor: An optional executor to share between clients.
+                It must use the same NATS client. When provided, the executor's
+                own max wait takes precedence over default_max_wait.
+
+        Raises:
+            ValueError: If the request executor uses a different NATS client.
+        """
+        if request_executor is None:
+            request_executor = RequestManyExecutor(nc, default_max_wait)
+        elif request_executor.nc is not nc:
+            raise ValueError("request executor must use the same NATS client")
         self.nc = nc
         self.api_prefix = api_prefix
-        self.request_executor = RequestManyExecutor(nc, default_max_wait)
+        self.request_executor = request_executor
 
     async def request(
         self,
@@ -50,8 +104,9 @@ class Client:
         Returns:
 
         """
+        payload = b"" if data is None else data
         response = await self.nc.request(
-            subject, data or b"", headers=headers, timeout=timeout
+            subject, payload, headers=headers, timeout=timeout
         )
         if response.headers:
             error_code = response.headers.get("Nats-Service-Error-Code")
@@ -70,16 +125,14 @@ class Client:
         max_interval: float | None = None,
     ) -> list[PingInfo]:
         """Ping all the services."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.PING, service, None, self.api_prefix
-        )
+        subject = _subject(_PING, service, None, self.api_prefix)
         responses = await self.request_executor(
             subject,
             max_count=max_count,
             max_wait=max_wait,
             max_interval=max_interval,
         )
-        return [PingInfo.from_response(json.loads(res.data)) for res in responses]
+        return _parse_many(responses, PingInfo)
 
     async def info(
         self,
@@ -89,16 +142,14 @@ class Client:
         max_interval: float | None = None,
     ) -> list[ServiceInfo]:
         """Get all service informations."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.INFO, service, None, self.api_prefix
-        )
+        subject = _subject(_INFO, service, None, self.api_prefix)
         responses = await self.request_executor(
             subject,
             max_count=max_count,
             max_wait=max_wait,
             max_interval=max_interval,
         )
-        return [ServiceInfo.from_response(json.loads(res.data)) for res in responses]
+        return _parse_many(responses, ServiceInfo)
 
     async def stats(
         self,
@@ -108,16 +159,14 @@ class Client:
         max_interval: float | None = None,
     ) -> list[ServiceStats]:
         """Get all services stats."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.STATS, service, None, self.api_prefix
-        )
+        subject = _subject(_STATS, service, None, self.api_prefix)
         responses = await self.request_executor(
             subject,
             max_count=max_count,
             max_wait=max_wait,
             max_interval=max_interval,
         )
-        return [ServiceStats.from_response(json.loads(res.data)) for res in responses]
+        return _parse_many(responses, ServiceStats)
 
     def ping_iter(
         self,
@@ -127,20 +176,7 @@ class Client:
         max_interval: float | None = None,
     ) -> AsyncContextManager[AsyncIterator[PingInfo]]:
         """Ping all the services."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.PING, service, None, self.api_prefix
-        )
-        return transform(
-            RequestManyIterator(
-                self.nc,
-                subject,
-                inbox=self.nc.new_inbox(),
-                max_count=max_count,
-                max_wait=max_wait,
-                max_interval=max_interval,
-            ),
-            lambda res: PingInfo.from_response(json.loads(res.data)),
-        )
+        return self._iter(_PING, PingInfo, service, max_wait, max_count, max_interval)
 
     def info_iter(
         self,
@@ -150,19 +186,8 @@ class Client:
         max_interval: float | None = None,
     ) -> AsyncContextManager[AsyncIterator[ServiceInfo]]:
         """Get all service informations."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.INFO, service, None, self.api_prefix
-        )
-        return transform(
-            RequestManyIterator(
-                self.nc,
-                subject,
-                inbox=self.nc.new_inbox(),
-                max_count=max_count,
-                max_wait=max_wait,
-                max_interval=max_interval,
-            ),
-            lambda res: ServiceInfo.from_response(json.loads(res.data)),
+        return self._iter(
+            _INFO, ServiceInfo, service, max_wait, max_count, max_interval
         )
 
     def stats_iter(
@@ -173,9 +198,21 @@ class Client:
         max_interval: float | None = None,
     ) -> AsyncContextManager[AsyncIterator[ServiceStats]]:
         """Get all services stats."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.STATS, service, None, self.api_prefix
+        return self._iter(
+            _STATS, ServiceStats, service, max_wait, max_count, max_interval
         )
+
+    def _iter(
+        self,
+        verb: internal.ServiceVerb,
+        cls: type[M],
+        service: str | None,
+        max_wait: float | None,
+        max_count: int | None,
+        max_interval: float | None,
+    ) -> AsyncContextManager[AsyncIterator[M]]:
+        """Iterate over the responses to a verb as they are received."""
+        subject = _subject(verb, service, None, self.api_prefix)
         return transform(
             RequestManyIterator(
                 self.nc,
@@ -185,7 +222,7 @@ class Client:
                 max_wait=max_wait,
                 max_interval=max_interval,
             ),
-            lambda res: ServiceStats.from_response(json.loads(res.data)),
+            partial(_parse_one, cls),
         )
 
     def service(self, service: str) -> Service:
@@ -198,6 +235,8 @@ class Client:
 
 
 class Service:
+    __slots__ = ("client", "service")
+
     def __init__(self, client: Client, service: str) -> None:
         self.client = client
         self.service = service
@@ -262,6 +301,8 @@ class Service:
 
 
 class Instance:
+    __slots__ = ("client", "service", "id")
+
     def __init__(self, client: Client, service: str, id: str) -> None:
         self.client = client
         self.service = service
@@ -272,33 +313,34 @@ class Instance:
         timeout: float = 0.5,
     ) -> PingInfo:
         """Ping a service instance."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.PING, self.service, self.id, self.client.api_prefix
-        )
+        subject = _subject(_PING, self.service, self.id, self.client.api_prefix)
         response = await self.client.nc.request(subject, b"", timeout=timeout)
-        return PingInfo.from_response(json.loads(response.data))
+        return _parse_one(PingInfo, response)
 
     async def info(
         self,
         timeout: float = 0.5,
     ) -> ServiceInfo:
         """Get the service instance information."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.INFO, self.service, self.id, self.client.api_prefix
-        )
+        subject = _subject(_INFO, self.service, self.id, self.client.api_prefix)
         response = await self.client.nc.request(subject, b"", timeout=timeout)
-        return ServiceInfo.from_response(json.loads(response.data))
+        return _parse_one(ServiceInfo, response)
 
     async def stats(
         self,
         timeout: float = 0.5,
     ) -> ServiceStats:
         """Get the service instance stats."""
-        subject = internal.get_internal_subject(
-            internal.ServiceVerb.STATS,
-            self.service,
-            self.id,
-            self.client.api_prefix,
-        )
+        subject = _subject(_STATS, self.service, self.id, self.client.api_prefix)
         response = await self.client.nc.request(subject, b"", timeout=timeout)
-        return ServiceStats.from_response(json.loads(response.data))
+        return _parse_one(ServiceStats, response)
+
+
+def _parse_one(cls: type[M], response: Msg) -> M:
+    """Parse a single JSON response."""
+    return cls.from_response(json_loads(response.data))
+
+
+def _parse_many(responses: list[Msg], cls: type[M]) -> list[M]:
+    """Parse several JSON responses, each payload on its own."""
+    return list(map(partial(_parse_one, cls), responses))
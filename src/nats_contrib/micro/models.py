@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import datetime
 from dataclasses import dataclass, fields, replace
+from functools import lru_cache
 from typing import Any, TypeVar
 
 T = TypeVar("T", bound="Base")
@@ -15,10 +16,7 @@ class Base:
 
         Unknown fields are ignored ("open-world assumption").
         """
-        params = {}
-        for field in fields(cls):
-            if field.name in resp:
-                params[field.name] = resp[field.name]
+        params = {name: resp[name] for name in _field_names(cls) if name in resp}
         return cls(**params)
 
     def as_dict(self) -> dict[str, Any]:
@@ -59,6 +57,12 @@ class Base:
         return date.isoformat().replace("+00:00", "Z").replace(".000000", "")
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type[Base]) -> tuple[str, ...]:
+    """Get the names of the fields of a model class."""
+    return tuple(field.name for field in fields(cls))
+
+
 @dataclass
 class EndpointStats(Base):
     """
@@ -119,6 +119,7 @@ def service(
         )
         dc = dataclass()(cls)
         dc.__service_spec__ = spec
+        dc.__micro_endpoints__ = collect_endpoints_specs(dc)
         return cls
 
     return func
@@ -142,6 +143,7 @@ def group(
         )
         dc = dataclass()(cls)
         dc.__group_spec__ = spec
+        dc.__micro_endpoints__ = collect_endpoints_specs(dc)
         return cls
 
     return func
@@ -279,7 +281,37 @@ def get_group_spec(instance: object) -> GroupSpec:
         raise TypeError("Group must be decorated with @group")
 
 
+def collect_endpoints_specs(cls: type[Any]) -> tuple[tuple[str, EndpointSpec], ...]:
+    """Collect the endpoints specs defined on a class.
+
+    This is done once when the class is decorated, so that
+    endpoints specs do not need to be looked up each time a
+    service or group is registered.
+    """
+    return tuple(
+        (name, member.__endpoint_spec__)
+        for name, member in inspect.getmembers(cls)
+        if hasattr(member, "__endpoint_spec__")
+    )
+
+
 def get_endpoints_specs(instance: object) -> Iterator[tuple[Handler, EndpointSpec]]:
-    for _, member in inspect.getmembers(instance):
+    # Subclasses which were not decorated must not reuse the parent endpoints
+    endpoints = type(instance).__dict__.get("__micro_endpoints__")
+    if endpoints is None:
+        for _, member in inspect.getmembers(instance):
+            if hasattr(member, "__endpoint_spec__"):
+                yield member, member.__endpoint_spec__
+        return
+    # Endpoints may also be set on the instance itself (e.g. in __post_init__)
+    attrs: dict[str, Any] = getattr(instance, "__dict__", {})
+    found: dict[str, tuple[Handler, EndpointSpec]] = {
+        name: (getattr(instance, name), spec)
+        for name, spec in endpoints
+        if name not in attrs
+    }
+    for name, member in attrs.items():
         if hasattr(member, "__endpoint_spec__"):
-            yield member, member.__endpoint_spec__
+            found[name] = (member, member.__endpoint_spec__)
+    for name in sorted(found):
+        yield found[name]
@@ -4,6 +4,7 @@ import asyncio
 import contextlib
 import datetime
 import signal
+import warnings
 from typing import Any, AsyncContextManager, Awaitable, Callable, Coroutine, TypeVar
 
 from nats.aio.client import Client as NATS
@@ -15,6 +16,8 @@ from .decorators import register_service, register_group
 T = TypeVar("T")
 E = TypeVar("E")
 
+_DEFAULT_SIGNALS = (signal.Signals.SIGINT, signal.Signals.SIGTERM)
+
 
 class Context:
     """A class to run micro services easily.
@@ -27,17 +30,32 @@ class Context:
     when a signal is received easily.
     """
 
+    __slots__ = (
+        "exit_stack",
+        "client",
+        "services",
+        "_cancelled",
+        "_cancel_future",
+        "_cancel_event",
+        "_client_entered",
+    )
+
     def __init__(self, client: NATS | None = None):
         self.exit_stack = contextlib.AsyncExitStack()
-        self.cancel_event = asyncio.Event()
         self.client = client or NATS()
         self.services: list[Service] = []
+        self._cancelled = False
+        self._cancel_future: asyncio.Future[None] | None = None
+        self._cancel_event: asyncio.Event | None = None
+        self._client_entered = False
 
     async def connect(self, *options: ConnectOption) -> None:
         """Connect to the NATS server. Does not raise an error when cancelled"""
         await self.wait_for(connect(client=self.client, *options))
-        if not self.cancelled():
-            await self.enter(self.client)
+        if not self.cancelled() and not self._client_entered:
+            # The client is not pushed on the exit stack, it is closed
+            # after all other contexts in __aexit__
+            self._client_entered = True
 
     async def add_service(
         self,
@@ -111,12 +129,36 @@ class Context:
             service.reset()
 
     def cancel(self) -> None:
-        """Set the cancel event."""
-        self.cancel_event.set()
+        """Cancel the context."""
+        self._cancelled = True
+        if self._cancel_future is not None and not self._cancel_future.done():
+            self._cancel_future.set_result(None)
+        if self._cancel_event is not None:
+            self._cancel_event.set()
 
     def cancelled(self) -> bool:
         """Check if the context was cancelled."""
-        return self.cancel_event.is_set()
+        return self._cancelled
+
+    @property
+    def cancel_event(self) -> asyncio.Event:
+        """An event set when the context is cancelled.
+
+        Deprecated: use cancel(), cancelled() and wait() instead.
+        The event is only a view of the context state: setting it
+        does not cancel the context.
+        """
+        warnings.warn(
+            "Context.cancel_event is deprecated, use cancel(), cancelled() "
+            "and wait() instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if self._cancel_event is None:
+            self._cancel_event = asyncio.Event()
+            if self._cancelled:
+                self._cancel_event.set()
+        return self._cancel_event
 
     def add_disconnected_callback(
         self, callback: Callable[[], Awaitable[None]]
@@ -153,18 +195,21 @@ class Context:
     def trap_signal(self, *signals: signal.Signals) -> None:
         """Notify the context that a signal has been received."""
         if not signals:
-            signals = (signal.Signals.SIGINT, signal.Signals.SIGTERM)
-        loop = asyncio.get_event_loop()
+            signals = _DEFAULT_SIGNALS
+        loop = asyncio.get_running_loop()
+        cancel = self.cancel
         for sig in signals:
-            loop.add_signal_handler(sig, self.cancel)
+            loop.add_signal_handler(sig, cancel)
 
     async def enter(self, async_context: AsyncContextManager[T]) -> T:
         """Enter an async context."""
         return await self.exit_stack.enter_async_context(async_context)
 
     async def wait(self) -> None:
-        """Wait for the cancel event to be set."""
-        await self.cancel_event.wait()
+        """Wait for the context to be cancelled."""
+        if self._cancelled:
+            return
+        await asyncio.shield(self._get_cancel_future())
 
     async def wait_for(self, coro: Coroutine[Any, Any, Any]) -> None:
         """Run a coroutine in the context and cancel it context is cancelled.
@@ -173,7 +218,20 @@ class Context:
         You can use .cancelled() on the context to check if the coroutine was
         cancelled.
         """
-        await _run_until_first_complete(coro, self.wait())
+        if self._cancelled:
+            coro.close()
+            return
+        await _run_until_first_complete(coro, asyncio.shield(self._get_cancel_future()))
+
+    def _get_cancel_future(self) -> asyncio.Future[None]:
+        """Get the future resolved when the context is cancelled.
+
+        The future is shared by all waiters, so it must always be
+        shielded before being awaited.
+        """
+        if self._cancel_future is None:
+            self._cancel_future = asyncio.get_running_loop().create_future()
+        return self._cancel_future
 
     async def __aenter__(self) -> "Context":
         await self.exit_stack.__aenter__()
@@ -184,6 +242,9 @@ class Context:
             await self.exit_stack.__aexit__(None, None, None)
         finally:
             self.services.clear()
+            if self._client_entered:
+                self._client_entered = False
+                await self.client.close()
 
     async def run_forever(
         self,
@@ -195,8 +256,12 @@ class Context:
         """Useful in a main function of a program.
 
         This method will first connect to the NATS server using the provided
-        options. It will then run the setup function and finally enter any
-        additional services provided.
+        options, unless the client is already connected (or connecting, or
+        reconnecting). It will then run the setup function and finally enter
+        any additional services provided.
+
+        When the connection is opened by this method, it is closed
+        when the context exits.
 
         If trap_signals is True, it will trap SIGINT and SIGTERM signals
         and cancel the context when one of these signals is received.
@@ -217,15 +282,29 @@ class Context:
             setup: A coroutine to setup the program.
             options: The options to pass to the connect method.
             trap_signals: If True, trap SIGINT and SIGTERM signals.
+
+        Raises:
+            ValueError: If options are provided while the client is already
+                connected, connecting or reconnecting.
         """
+        client_active = (
+            self.client.is_connected
+            or self.client.is_connecting
+            or self.client.is_reconnecting
+        )
+        if client_active and options:
+            raise ValueError(
+                "connect options cannot be used with an already connected client"
+            )
         async with self as ctx:
             if trap_signals:
                 if trap_signals is True:
-                    trap_signals = (signal.Signals.SIGINT, signal.Signals.SIGTERM)
+                    trap_signals = _DEFAULT_SIGNALS
                 ctx.trap_signal(*trap_signals)
-            await ctx.wait_for(connect(client=ctx.client, *options))
-            if ctx.cancelled():
-                return
+            if not client_active:
+                await ctx.connect(*options)
+                if ctx.cancelled():
+                    return
             await ctx.wait_for(setup(ctx))
             if ctx.cancelled():
                 return
@@ -265,24 +344,29 @@ def _chain1(
 
 
 async def _run_until_first_complete(
-    *coros: Coroutine[Any, Any, Any],
+    *aws: Awaitable[Any],
 ) -> None:
-    """Run a bunch of coroutines and stop as soon as the first stops."""
-    tasks: list[asyncio.Task[Any]] = [asyncio.create_task(coro) for coro in coros]
+    """Run a bunch of awaitables and stop as soon as the first stops."""
+    tasks: list[asyncio.Future[Any]] = [asyncio.ensure_future(aw) for aw in aws]
     try:
-        await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-    finally:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    except BaseException:
         for task in tasks:
-            if not task.done():
-                task.cancel()
-    # Make sure all tasks are cancelled AND finished
-    await asyncio.wait(tasks, return_when=asyncio.ALL_COMPLETED)
+            task.cancel()
+        raise
+    for task in pending:
+        task.cancel()
+    # Make sure pending tasks are cancelled AND finished
+    results = await asyncio.gather(*pending, return_exceptions=True)
     # Check for exceptions
-    for task in tasks:
+    for task in done:
         if task.cancelled():
             continue
         if err := task.exception():
             raise err
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
 
 
 def run(
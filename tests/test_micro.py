@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import datetime
-from typing import AsyncIterator
+import importlib
+import sys
+from typing import Any, AsyncIterator, Callable, Iterator
 
 import pytest
 import pytest_asyncio
 from nats.aio.client import Client as NATS
+from nats.aio.msg import Msg
+from nats_contrib.request_many import RequestManyExecutor
 from nats_contrib.test_server import NATSD
 
 from nats_contrib import micro
@@ -334,6 +339,78 @@ class TestMicro(MicroTestSetup):
             ).stats()
             assert result == expected
 
+    async def test_stats_many_instances(self) -> None:
+        ids = iter(["1", "2"])
+        async with contextlib.AsyncExitStack() as stack:
+            for _ in range(2):
+                await stack.enter_async_context(
+                    micro.add_service(
+                        self.nats_client,
+                        self.service_name(),
+                        self.service_version(),
+                        id_generator=lambda: next(ids),
+                        now=self.now,
+                    )
+                )
+            results = await self.micro_client.stats(max_count=2)
+            assert sorted(result.id for result in results) == ["1", "2"]
+            for result in results:
+                assert result.started == UNIX_START_TIME
+                assert result.endpoints == []
+
+    async def test_ping_rejects_concatenated_payloads(self) -> None:
+        async def respond(msg: Msg) -> None:
+            await msg.respond(b'{"name":"a","id":"1"},{"name":"b","id":"2"}')
+
+        sub = await self.nats_client.subscribe("$SRV.PING", cb=respond)
+        try:
+            async with micro.add_service(
+                self.nats_client,
+                self.service_name(),
+                self.service_version(),
+                id_generator=self.service_id,
+            ):
+                with pytest.raises(ValueError):
+                    await self.micro_client.ping(max_count=2)
+        finally:
+            await sub.unsubscribe()
+
+    async def test_subjects_are_cached(self) -> None:
+        subject = micro_client.client._subject
+        verb = micro.internal.ServiceVerb.PING
+        first = subject(verb, self.service_name(), None, "$SRV")
+        assert subject(verb, self.service_name(), None, "$SRV") is first
+        async with micro.add_service(
+            self.nats_client,
+            self.service_name(),
+            self.service_version(),
+            id_generator=self.service_id,
+        ):
+            await self.micro_client.ping(max_count=1)
+            misses = subject.cache_info().misses
+            for _ in range(3):
+                await self.micro_client.ping(max_count=1)
+            assert subject.cache_info().misses == misses
+
+    async def test_shared_request_executor(self) -> None:
+        client = micro_client.Client(
+            self.nats_client, request_executor=self.micro_client.request_executor
+        )
+        assert client.request_executor is self.micro_client.request_executor
+        async with micro.add_service(
+            self.nats_client,
+            self.service_name(),
+            self.service_version(),
+            id_generator=self.service_id,
+        ):
+            results = await client.ping(max_count=1)
+            assert [result.id for result in results] == [self.service_id()]
+
+    async def test_request_executor_must_use_same_client(self) -> None:
+        executor = RequestManyExecutor(NATS())
+        with pytest.raises(ValueError):
+            micro_client.Client(self.nats_client, request_executor=executor)
+
     async def test_info_getter(self) -> None:
         async with micro.add_service(
             self.nats_client,
@@ -919,6 +996,37 @@ class TestMicroGroupWithSubgroup(MicroTestSetup):
             )
 
 
+@pytest.fixture
+def stdlib_json_loads() -> Iterator[Callable[[bytes], Any]]:
+    """Reload the client module as if orjson was not installed."""
+    module = micro_client.client
+    orjson = sys.modules.get("orjson")
+    sys.modules["orjson"] = None  # type: ignore
+    try:
+        yield importlib.reload(module).json_loads
+    finally:
+        if orjson is None:
+            del sys.modules["orjson"]
+        else:
+            sys.modules["orjson"] = orjson
+        importlib.reload(module)
+
+
+class TestJsonLoads:
+    def test_orjson_is_used_when_installed(self) -> None:
+        import orjson
+
+        assert micro_client.client.json_loads is orjson.loads
+
+    def test_stdlib_fallback(self, stdlib_json_loads: Callable[[bytes], Any]) -> None:
+        assert stdlib_json_loads.__module__ == micro_client.client.__name__
+        assert stdlib_json_loads(b'{"name":"\xc3\xa9"}') == {"name": "\u00e9"}
+        assert stdlib_json_loads('{"id":"1"}') == {"id": "1"}  # type: ignore
+        payload = '{"name":"\u00e9"}'
+        for encoding in ("utf-16", "utf-16-le", "utf-32-be"):
+            assert stdlib_json_loads(payload.encode(encoding)) == {"name": "\u00e9"}
+
+
 class TestMicroModels:
     def test_copy_pong_and_mutate(self) -> None:
         pong = micro.models.PingInfo(
@@ -982,3 +1090,140 @@ class TestMicroModels:
             )
         )
         assert stats2.endpoints != stats.endpoints
+
+
+@micro.sdk.service(name="service1", version="0.0.1")
+class DecoratedService:
+    greeting: str
+
+    @micro.sdk.endpoint(subject="hello")
+    async def hello(self, request: micro.Request) -> None:
+        await request.respond(self.greeting.encode())
+
+    @micro.sdk.endpoint(disabled=True)
+    async def disabled(self, request: micro.Request) -> None:
+        await request.respond(b"disabled")
+
+
+@micro.sdk.service(name="service1", version="0.0.1")
+class DecoratedServiceWithInstanceEndpoint:
+    def __post_init__(self) -> None:
+        async def extra(request: micro.Request) -> None:
+            await request.respond(b"extra")
+
+        self.extra = micro.sdk.endpoint(subject="extra")(extra)
+
+    @micro.sdk.endpoint(subject="hello")
+    async def hello(self, request: micro.Request) -> None:
+        await request.respond(b"hello")
+
+
+class TestMicroDecorators(MicroTestSetup):
+    async def test_register_service(self) -> None:
+        assert [
+            name for name, _ in DecoratedService.__micro_endpoints__  # type: ignore
+        ] == ["disabled", "hello"]
+        async with micro.register_service(
+            self.nats_client,
+            DecoratedService(greeting="hi"),
+            id_generator=self.service_id,
+        ):
+            reply = await self.micro_client.request("hello")
+            assert reply.data == b"hi"
+            result = (
+                await self.micro_client.service(self.service_name())
+                .instance(self.service_id())
+                .info()
+            )
+            assert [ep.name for ep in result.endpoints] == ["hello"]
+
+    async def test_register_service_with_instance_endpoint(self) -> None:
+        async with micro.register_service(
+            self.nats_client,
+            DecoratedServiceWithInstanceEndpoint(),
+            id_generator=self.service_id,
+        ):
+            reply = await self.micro_client.request("extra")
+            assert reply.data == b"extra"
+            result = (
+                await self.micro_client.service(self.service_name())
+                .instance(self.service_id())
+                .info()
+            )
+            assert [ep.name for ep in result.endpoints] == ["extra", "hello"]
+
+
+class TestContextRunForever(MicroTestSetup):
+    async def test_run_forever_connects_and_closes_client(self) -> None:
+        ctx = micro.sdk.Context()
+
+        async def setup(ctx: micro.sdk.Context) -> None:
+            assert ctx.client.is_connected
+            ctx.cancel()
+
+        await ctx.run_forever(setup)
+        assert ctx.client.is_closed
+
+    async def test_run_forever_reuses_connected_client(self) -> None:
+        ctx = micro.sdk.Context(client=self.nats_client)
+
+        async def setup(ctx: micro.sdk.Context) -> None:
+            ctx.cancel()
+
+        await ctx.run_forever(setup)
+        assert self.nats_client.is_connected
+
+    async def test_run_forever_rejects_options_for_connected_client(self) -> None:
+        ctx = micro.sdk.Context(client=self.nats_client)
+
+        async def setup(ctx: micro.sdk.Context) -> None:
+            ctx.cancel()
+
+        with pytest.raises(ValueError):
+            await ctx.run_forever(setup, micro.sdk.option.WithServer("nats://x"))
+        assert self.nats_client.is_connected
+
+
+@pytest.mark.asyncio
+class TestContext:
+    async def test_wait_for_returns_when_coroutine_completes(self) -> None:
+        async with micro.sdk.Context() as ctx:
+            await ctx.wait_for(asyncio.sleep(0))
+            await ctx.wait_for(asyncio.sleep(0))
+            assert not ctx.cancelled()
+
+    async def test_wait_for_returns_when_cancelled(self) -> None:
+        async with micro.sdk.Context() as ctx:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, ctx.cancel)
+            await ctx.wait_for(asyncio.sleep(10))
+            assert ctx.cancelled()
+
+    async def test_wait_for_does_not_run_coroutine_when_cancelled(self) -> None:
+        called = False
+
+        async def coro() -> None:
+            nonlocal called
+            called = True
+
+        async with micro.sdk.Context() as ctx:
+            ctx.cancel()
+            await ctx.wait_for(coro())
+        assert not called
+
+    async def test_cancel_event_is_deprecated(self) -> None:
+        async with micro.sdk.Context() as ctx:
+            with pytest.deprecated_call():
+                event = ctx.cancel_event
+            assert not event.is_set()
+            ctx.cancel()
+            assert event.is_set()
+
+    async def test_wait_for_raises_coroutine_error(self) -> None:
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        async with micro.sdk.Context() as ctx:
+            with pytest.raises(ValueError, match="boom"):
+                await ctx.wait_for(fail())
+            assert not ctx.cancelled()